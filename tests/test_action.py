@@ -1,4 +1,5 @@
 from pathlib import Path
+import modin.pandas as pd
 
 import whyqd as qd
 from whyqd.parsers import CoreParser
@@ -165,6 +166,28 @@ class TestAction:
         ]
         assert _test_script_action(script, INTERIM_SCHEMA_CTHULHU, DESTINATION_SCHEMA_CTHULHU, INTERIM_DATA_CTHULHU)
 
+    def test_separate_split_ragged(self):
+        column = pd.Series(["a;;b;;c", "d", "e;;f"])
+        split = CORE.split_column(column=column, by=";;")
+        assert split.tolist() == [["a", "b", "c"], ["d", None, None], ["e", "f", None]]
+
+    def test_separate_split_nulls(self):
+        column = pd.Series(["a;;b", None, "c"])
+        split = CORE.split_column(column=column, by=";;")
+        assert split.tolist() == [["a", "b"], [None, None], ["c", None]]
+        column = pd.Series([None, None], dtype=object)
+        split = CORE.split_column(column=column, by=";;")
+        assert split.tolist() == [[None], [None]]
+
+    def test_separate_split_fallback(self):
+        # Mixed values can't be converted to an arrow string array, so are split by pandas, and the separator must
+        # still be treated as a literal string rather than a regex
+        column = pd.Series(["a + b", 1, "c"])
+        split = CORE.split_column(column=column, by=" + ")
+        assert split[0].tolist() == ["a", "b"]
+        assert pd.isna(split[1]).all()
+        assert split[2][0] == "c" and pd.isna(split[2][1])
+
     def test_unite(self):
         script = "UNITE > 'reference' < ['Reference 1', 'Reference 2', 'Reference 3', 'Reference 4', 'Reference 5', 'Reference 6', 'Reference 7', 'Reference 8']"
         assert _test_script_action(script, INTERIM_SCHEMA_CTHULHU, DESTINATION_SCHEMA_CTHULHU, INTERIM_DATA_CTHULHU)
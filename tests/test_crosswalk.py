@@ -47,6 +47,25 @@ class TestCrosswalk:
         c["schemaDestination"].pop("version", None)
         assert c == CROSSWALK
 
+    def test_load_add_validate(self, tmp_path):
+        DIRECTORY = tmp_path
+        CORE.check_path(directory=DIRECTORY)
+        crosswalk = qd.CrosswalkDefinition()
+        crosswalk.set(
+            crosswalk={"name": "test_crosswalk"},
+            schema_source=SOURCE_SCHEMA_PATH,
+            schema_destination=DESTINATION_SCHEMA_PATH,
+        )
+        crosswalk.save(directory=DIRECTORY, hide_uuid=True)
+        # Actions added to a loaded crosswalk must not change the schemas it was saved with
+        crosswalk = qd.CrosswalkDefinition(crosswalk=DIRECTORY / "test_crosswalk.crosswalk")
+        crosswalk.actions.add_multi(terms=SCHEMA_SCRIPTS)
+        c = crosswalk.exclude_uuid(model=crosswalk.get)
+        c.pop("version", None)
+        c["schemaSource"].pop("version", None)
+        c["schemaDestination"].pop("version", None)
+        assert c == CROSSWALK
+
     def test_add_remove_update(self):
         crosswalk = qd.CrosswalkDefinition()
         crosswalk.set(
@@ -67,3 +86,16 @@ class TestCrosswalk:
         CW = set(SCHEMA_SCRIPTS)
         assert cw - CW == {NEW_SCRIPT}
         assert CW - cw == set([SCHEMA_SCRIPTS[0], SCHEMA_SCRIPTS[-1]])
+
+    def test_transform_provenance(self):
+        crosswalk = qd.CrosswalkDefinition()
+        crosswalk.set(
+            crosswalk={"name": "test_crosswalk"},
+            schema_source=SOURCE_SCHEMA_PATH,
+            schema_destination=DESTINATION_SCHEMA_PATH,
+        )
+        transform = qd.TransformDefinition(crosswalk=crosswalk)
+        # Later edits to the crosswalk don't rewrite the crosswalk recorded by the transform
+        crosswalk.actions.add(term="DEBLANK")
+        assert transform.model.crosswalk is not crosswalk.get
+        assert not transform.model.crosswalk.actions
@@ -1,8 +1,11 @@
 from pathlib import Path
 import csv
+import hashlib
+import modin.pandas as pd
+import numpy as np
 
 import whyqd as qd
-from whyqd.parsers import CoreParser
+from whyqd.parsers import CoreParser, DataSourceParser
 
 DIRECTORY = Path(__file__).resolve().parent / "data"
 BASE_DIRECTORY = f"{Path('__file__').resolve().parent}/"
@@ -71,3 +74,31 @@ class TestDataSource:
         datasource = qd.DataSourceDefinition()
         datasource.derive_model(source=DATA["CSV"], mimetype=CSVTYPE, quoting=csv.QUOTE_ALL)
         datasource.validate()
+
+    def test_parse_float_column(self):
+        reader = DataSourceParser()
+        # Clean numerics convert in a single pass
+        column = pd.Series([1, 2.5, "3", "-4.25"])
+        assert reader.parse_float_column(column=column).tolist() == [1.0, 2.5, 3.0, -4.25]
+        # Malformed floats fall back to the per-value parser, and nulls stay null
+        column = pd.Series(["1,234", "£1,234.56", "abc", None, np.nan])
+        parsed = reader.parse_float_column(column=column)
+        assert parsed[:2].tolist() == [1234.0, 1234.56]
+        assert parsed[2:].isna().all()
+        # String-dtype columns
+        column = pd.Series(["1,234.5", "5", None], dtype="string")
+        parsed = reader.parse_float_column(column=column)
+        assert parsed[:2].tolist() == [1234.5, 5.0]
+        assert parsed[2:].isna().all()
+
+    def test_checksum_rewrite(self, tmp_path):
+        core = CoreParser()
+        source = tmp_path / "checksum.csv"
+        source.write_text("a,b\n1,2\n")
+        checksum = core.get_checksum(source=source)
+        assert core.get_checksum(source=source) == checksum
+        # A rewritten file is re-hashed
+        source.write_text("a,b\n1,2\n3,4\n")
+        resized = core.get_checksum(source=source)
+        assert resized != checksum
+        assert resized == hashlib.blake2b(source.read_bytes()).hexdigest()
@@ -1,5 +1,6 @@
 from pathlib import Path
 import json
+import pytest
 
 import whyqd as qd
 from whyqd.parsers import CoreParser
@@ -83,3 +84,120 @@ class TestSchema:
         D["name"] = s.get.name
         D.pop("version", None)
         assert d == json.dumps(D)
+
+    def _build_fields(self):
+        s = qd.SchemaDefinition()
+        s.set(schema={"name": "test_schema"})
+        s.fields.add_multi(terms=SCHEMA_DATA["SOURCE"]["fields"])
+        return s.fields
+
+    def test_fields_reorder(self):
+        fields = self._build_fields()
+        names = [f.name for f in fields.get_all()]
+        fields.reorder(order=[f.uuid for f in reversed(fields.get_all())])
+        assert [f.name for f in fields.get_all()] == names[::-1]
+        # Get, update and remove still resolve against the reordered list
+        field = fields.get(name="postcode")
+        assert fields.get(name=field.uuid) is field
+        fields.update(term={"name": "postcode", "type": "string", "title": "Postal code"})
+        assert fields.get(name="postcode").title == "Postal code"
+        fields.remove(name="postcode")
+        assert fields.get(name="postcode") is None
+        assert fields.get(name=field.uuid) is None
+        assert [f.name for f in fields.get_all()] == [n for n in names[::-1] if n != "postcode"]
+        # String references are also accepted
+        fields.reorder(order=[f.uuid.hex for f in reversed(fields.get_all())])
+        assert [f.name for f in fields.get_all()] == [n for n in names if n != "postcode"]
+        fields.remove(name=names[0])
+        assert [f.name for f in fields.get_all()] == [n for n in names[1:] if n != "postcode"]
+
+    def test_fields_remove(self):
+        fields = self._build_fields()
+        names = [f.name for f in fields.get_all()]
+        # Last term
+        fields.remove(name=names[-1])
+        assert [f.name for f in fields.get_all()] == names[:-1]
+        assert fields.get(name=names[-1]) is None
+        # Middle term
+        field = fields.get(name=names[3])
+        fields.remove(name=field.uuid)
+        assert [f.name for f in fields.get_all()] == names[:3] + names[4:-1]
+        assert fields.get(name=names[3]) is None
+        # Positions are still resolved correctly after both removals
+        fields.remove(name=names[-2])
+        fields.remove(name=names[0])
+        assert [f.name for f in fields.get_all()] == names[1:3] + names[4:-2]
+        for name in names[1:3] + names[4:-2]:
+            assert fields.get(name=name).name == name
+
+    def test_fields_add_multi_duplicates(self):
+        fields = self._build_fields()
+        names = [f.name for f in fields.get_all()]
+        # Duplicates of existing terms
+        with pytest.raises(ValueError):
+            fields.add_multi(terms=[{"name": "new_field", "type": "string"}, {"name": "postcode", "type": "string"}])
+        # Duplicates within the new terms
+        with pytest.raises(ValueError):
+            fields.add_multi(terms=[{"name": "new_field", "type": "string"}, {"name": "new_field", "type": "number"}])
+        assert [f.name for f in fields.get_all()] == names
+        assert fields.get(name="new_field") is None
+
+    def test_fields_reorder_duplicates(self):
+        fields = self._build_fields()
+        names = [f.name for f in fields.get_all()]
+        order = [f.uuid for f in fields.get_all()]
+        order[-1] = order[0]
+        with pytest.raises(ValueError):
+            fields.reorder(order=order)
+        assert [f.name for f in fields.get_all()] == names
+
+    def test_update_metadata(self):
+        s = qd.SchemaDefinition(source=SCHEMA_SOURCE)
+        model = s.get
+        fields = list(model.fields)
+        # A metadata-only update patches the model in place, and leaves its terms untouched
+        s.set(schema={"name": "renamed_schema", "title": "Renamed Schema"})
+        assert s.get is model
+        assert s.get.name == "renamed_schema"
+        assert s.get.title == "Renamed Schema"
+        assert s.get.description == SCHEMA_DATA["SOURCE"]["description"]
+        assert len(s.get.fields) == len(fields)
+        assert all(a is b for a, b in zip(s.get.fields, fields))
+        assert [f.name for f in s.fields.get_all()] == [f["name"] for f in SCHEMA_DATA["SOURCE"]["fields"]]
+
+    def test_fields_rename_directly(self):
+        fields = self._build_fields()
+        field = fields.get_all()[0]
+        old_name = field.name
+        field.name = "renamed_field"
+        # A term renamed directly is still found by its new name, and not by its old one
+        assert fields.get(name="renamed_field") is field
+        assert fields.get(name=old_name) is None
+        # Duplicates of the new name are rejected
+        with pytest.raises(ValueError):
+            fields.add(term={"name": "renamed_field", "type": "string"})
+        field = fields.get_all()[1]
+        field.name = "renamed_again"
+        with pytest.raises(ValueError):
+            fields.add_multi(terms=[{"name": "renamed_again", "type": "string"}])
+        # And it can be updated and removed
+        fields.update(term={"name": "renamed_field", "type": "string", "title": "Renamed field"})
+        assert fields.get(name="renamed_field").title == "Renamed field"
+        fields.remove(name="renamed_again")
+        assert fields.get(name="renamed_again") is None
+        assert fields.get_all()[0].name == "renamed_field"
+
+    def test_fields_boolean_categories(self):
+        fields = self._build_fields()
+        # A boolean field with other constraints, but no categories, gets its default categories
+        fields.set_constraints(name="occupation_state", constraints={"required": True})
+        category = fields.get_category(name="occupation_state", category=True)
+        assert category.name is True
+        constraints = fields.get_constraints(name="occupation_state")
+        assert constraints.required
+        assert [c.name for c in constraints.category] == [True, False]
+        # A field of any other type with constraints, but no categories, is left untouched
+        fields.set_constraints(name="prop_ba_rates", constraints={"required": True})
+        with pytest.raises(ValueError):
+            fields.get_category(name="prop_ba_rates", category=True)
+        assert not fields.get_constraints(name="prop_ba_rates").category
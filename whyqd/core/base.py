@@ -4,6 +4,7 @@ from collections.abc import MutableMapping
 from pathlib import Path
 from datetime import date, datetime
 import json
+import orjson
 
 from whyqd.parsers import CoreParser
 from whyqd.models import VersionModel, CitationModel
@@ -12,10 +13,21 @@ from whyqd.models import VersionModel, CitationModel
 class BaseDefinition:
     """Core shared base definition functionality."""
 
+    __slots__ = ("_core", "model", "model_name", "_describe", "_hidden_json")
+
     def __init__(self, *, model_name: str) -> None:
-        self.core = CoreParser()
+        self._core = None
         self.model = None
         self.model_name = model_name  # method / schema / transform / etc.
+        self._describe = None  # cached (name, title, description) and its `describe` dictionary
+        self._hidden_json = None  # cached serialised model bytes and the json derived from them with UUIDs hidden
+
+    @property
+    def core(self) -> CoreParser:
+        """Core file and model utilities, only instantiated on first use."""
+        if self._core is None:
+            self._core = CoreParser()
+        return self._core
 
     def __repr__(self) -> str:
         """Returns the string representation of the model."""
@@ -35,11 +47,11 @@ class BaseDefinition:
           A dictionary with the `name`, `title` and `description` for the `Definition`.
         """
         if self.model:
-            return {
-                "name": self.model.name,
-                "title": self.model.title,
-                "description": self.model.description,
-            }
+            terms = (self.model.name, self.model.title, self.model.description)
+            if not self._describe or self._describe[0] != terms:
+                self._describe = (terms, dict(zip(("name", "title", "description"), terms)))
+            # A copy, so callers can't mutate the cached dictionary
+            return dict(self._describe[1])
         return None
 
     def _refresh_model_terms(self) -> None:
@@ -50,6 +62,17 @@ class BaseDefinition:
         """Refreshes the list of model fields and connects them to the Field CRUD"""
         pass
 
+    def _assign_model_terms(self, *, field: str, terms: list) -> None:
+        """Assign a list of terms, already validated by the CRUD, to a model field. Bypasses `validate_assignment`,
+        which would otherwise copy every term each time the model is refreshed."""
+        self._assign_model_value(field=field, value=list(terms))
+
+    def _assign_model_value(self, *, field: str, value: BaseModel | list | None) -> None:
+        """Assign an already validated value, such as the model of another definition, to a model field without
+        validating (and copying) it again."""
+        self.model.__dict__[field] = value
+        self.model.__fields_set__.add(field)
+
     #########################################################################################
     # MANAGE CITATION
     #########################################################################################
@@ -119,7 +142,11 @@ class BaseDefinition:
     def exclude_uuid(self, *, model: BaseModel | dict):
         # https://stackoverflow.com/a/49723101/295606
         if isinstance(model, BaseModel):
-            model = model.dict(by_alias=True, exclude_defaults=True, exclude_none=True, exclude={"uuid": True})
+            # A json round-trip produces a fresh, json-shaped copy in one C-level pass, so the UUIDs can then be
+            # stripped in place rather than rebuilding the tree a second time
+            excluded = orjson.loads(self.dump_model(model=model))
+            self._strip_uuid(data=excluded)
+            return excluded
         excluded = {}
         for key, field in model.items():
             if key != "uuid":
@@ -137,6 +164,29 @@ class BaseDefinition:
                     excluded[key] = field
         return excluded
 
+    def _strip_uuid(self, *, data: dict | list) -> None:
+        if isinstance(data, dict):
+            data.pop("uuid", None)
+            data = data.values()
+        for field in data:
+            if isinstance(field, (dict, list)):
+                self._strip_uuid(data=field)
+
+    def dump_model(self, *, model: BaseModel) -> bytes:
+        """Serialise a model directly to json-encoded bytes, ready to be written to file.
+
+        Parameters:
+          model: Pydantic model to serialise.
+
+        Returns:
+          Json-conforming bytes.
+        """
+        return orjson.dumps(
+            model.dict(by_alias=True, exclude_defaults=True, exclude_none=True),
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+
     def get_json(self, hide_uuid: bool = False) -> Json | None:
         """Get the json model.
 
@@ -149,11 +199,25 @@ class BaseDefinition:
         """
         self._refresh_model_terms()
         if self.model and not hide_uuid:
-            return self.model.json(by_alias=True, exclude_defaults=True, exclude_none=True)
+            return self.dump_model(model=self.model).decode()
         elif self.model and hide_uuid:
-            return json.dumps(self.exclude_uuid(model=self.model))
+            # Serialising with orjson is cheap, and the bytes show whether the model changed since the last call
+            dumped = self.dump_model(model=self.model)
+            if not self._hidden_json or self._hidden_json[0] != dumped:
+                self._hidden_json = (dumped, self._get_hidden_json(dumped=dumped))
+            return self._hidden_json[1]
         return None
 
+    def _get_hidden_json(self, *, dumped: bytes) -> Json:
+        """Get the json model, with all UUIDs hidden, from the model already serialised by `dump_model`."""
+        return json.dumps(self._get_hidden_data(dumped=dumped))
+
+    def _get_hidden_data(self, *, dumped: bytes) -> dict:
+        """Get the model data, with all UUIDs hidden, from the model already serialised by `dump_model`."""
+        data = orjson.loads(dumped)
+        self._strip_uuid(data=data)
+        return data
+
     def save(
         self,
         directory: str | None = None,
@@ -181,14 +245,19 @@ class BaseDefinition:
             directory = self.core.check_path(directory=directory)
         if not filename:
             filename = f"{self.model.name}.{self.model_name}"
-        if filename.split(".")[-1] != self.model_name:
+        if not filename.endswith(f".{self.model_name}"):
             filename += f".{self.model_name}"
         if isinstance(directory, str):
             directory = Path(directory)
         path = directory / filename
-        if "version" in self.model.dict():
+        if "version" in self.model.__fields__:
             update = VersionModel(**{"description": f"Save {self.model_name}."})
             if created_by:
                 update.name = created_by
             self.model.version.append(update)
-        return self.core.save_file(data=self.get_json(hide_uuid=hide_uuid), source=path)
+        if hide_uuid:
+            # The version update means the cached json is always stale here, so the data are streamed to file
+            data = self._get_hidden_data(dumped=self.dump_model(model=self.model))
+            return self.core.save_file(data=data, source=path)
+        # Write the serialised bytes directly, without an intermediate string
+        return self.core.save_file(data=self.dump_model(model=self.model), source=path)
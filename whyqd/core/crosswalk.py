@@ -30,6 +30,8 @@ class CrosswalkDefinition(BaseDefinition):
       ```
     """
 
+    __slots__ = ("crud", "schema_source", "schema_destination")
+
     def __init__(
         self,
         *,
@@ -46,7 +48,7 @@ class CrosswalkDefinition(BaseDefinition):
     def _refresh_model_terms(self) -> None:
         """Refreshes the list of terms and connects them to the Form Model"""
         if self.model:
-            self.model.actions = self.crud.get_all()
+            self._assign_model_terms(field="actions", terms=self.crud.get_all())
 
     def _refresh_model_fields(self) -> None:
         """Refreshes the list of terms and connects them to the Field CRUD"""
@@ -82,6 +84,8 @@ class CrosswalkDefinition(BaseDefinition):
         self.model = self.core.create_or_update_model(modelType=CrosswalkModel, source=crosswalk, model=self.model)
         # And update the original data
         # https://fastapi.tiangolo.com/tutorial/body-updates/#partial-updates-with-patch
+        # Schema fields are shared with the schema CRUD, and parsing actions may set their constraints, so the
+        # crosswalk keeps a detached copy of each schema as it was set
         if self.model.schemaSource and not schema_source:
             self.schema_source.set(schema=self.model.schemaSource)
         elif schema_source:
@@ -89,7 +93,7 @@ class CrosswalkDefinition(BaseDefinition):
                 self.schema_source = schema_source
             else:
                 self.schema_source.set(schema=schema_source)
-            self.model.schemaSource = self.schema_source.get
+            self._assign_model_value(field="schemaSource", value=self.schema_source.get.copy(deep=True))
         if self.model.schemaDestination and not schema_destination:
             self.schema_destination.set(schema=self.model.schemaDestination)
         elif schema_destination:
@@ -97,7 +101,7 @@ class CrosswalkDefinition(BaseDefinition):
                 self.schema_destination = schema_destination
             else:
                 self.schema_destination.set(schema=schema_destination)
-            self.model.schemaDestination = self.schema_destination.get
+            self._assign_model_value(field="schemaDestination", value=self.schema_destination.get.copy(deep=True))
         if self.model.schemaSource and self.model.schemaDestination:
             self.crud.set_schema(schema_source=self.schema_source, schema_destination=self.schema_destination)
             self._refresh_model_fields()
@@ -55,6 +55,8 @@ class DataSourceDefinition(BaseDefinition):
       ```
     """
 
+    __slots__ = ("reader", "data")
+
     def __init__(self, *, source: Path | str | DataSourceModel | None = None) -> None:
         super().__init__(model_name="data")
         self.reader = DataSourceParser()
@@ -210,9 +212,9 @@ class DataSourceDefinition(BaseDefinition):
         response = []
         for model in self.model:
             if not hide_uuid:
-                response.append(model.json(by_alias=True, exclude_defaults=True, exclude_none=True))
+                response.append(self.dump_model(model=model).decode())
             else:
-                json.dumps(self.exclude_uuid(model=model))
+                response.append(json.dumps(self.exclude_uuid(model=model)))
         return response
 
     def save(
@@ -243,11 +245,14 @@ class DataSourceDefinition(BaseDefinition):
             directory = self.core.check_path(directory=directory)
         if not filename:
             filename = f"{self.model.name}.{self.model_name}"
-        if filename.split(".")[-1] != self.model_name:
+        if not filename.endswith(f".{self.model_name}"):
             filename += f".{self.model_name}"
         if isinstance(directory, str):
             directory = Path(directory)
-        models = self.get_json(hide_uuid=hide_uuid)
+        if hide_uuid:
+            models = self.get_json(hide_uuid=hide_uuid)
+        else:
+            models = [self.dump_model(model=model) for model in self.model]
         for i, model in enumerate(models):
             filename = "".join(self.model[i].name.split(".")[:-1] + [f".{self.model_name}"])
             path = directory / filename
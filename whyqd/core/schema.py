@@ -1,5 +1,6 @@
 from __future__ import annotations
 from pathlib import Path
+import orjson
 
 from whyqd.models import FieldModel, SchemaModel, DataSourceModel
 from whyqd.crud.field import CRUDField
@@ -32,6 +33,8 @@ class SchemaDefinition(BaseDefinition):
       ```
     """
 
+    __slots__ = ("crud",)
+
     def __init__(self, *, source: Path | str | SchemaModel | None = None) -> None:
         super().__init__(model_name="schema")
         self.crud = CRUDField(FieldModel)
@@ -40,21 +43,28 @@ class SchemaDefinition(BaseDefinition):
     def _refresh_model_terms(self) -> None:
         """Refreshes the list of terms and connects them to the Form Model"""
         if self.model:
-            self.model.fields = self.crud.get_all()
+            self._assign_model_terms(field="fields", terms=self.crud.get_all())
 
     def _refresh_model_fields(self) -> None:
         """Refreshes the list of terms and connects them to the Field CRUD"""
         if self.model and self.model.fields:
             self.crud.reset()
-            if isinstance(self.model.fields[0], dict):
-                self.crud.add_multi(terms=self.model.fields)
-            else:
-                self.crud.add_multi(
-                    terms=[f.dict(by_alias=True, exclude_defaults=True, exclude_none=True) for f in self.model.fields]
-                )
+            # Fields are already validated with the model, so there's no need to round-trip them through `dict`
+            self.crud.add_multi(terms=self.model.fields)
         if self.model and not self.model.fields:
             self.crud.reset()
 
+    def _get_hidden_data(self, *, dumped: bytes) -> dict:
+        """Get the model data, with all UUIDs hidden, from the model already serialised by `dump_model`."""
+        if not any(f.constraints for f in self.model.fields):
+            # No nested category UUIDs, so only the schema and field UUIDs need to be removed
+            data = orjson.loads(dumped)
+            data.pop("uuid", None)
+            for field in data.get("fields", []):
+                field.pop("uuid", None)
+            return data
+        return super()._get_hidden_data(dumped=dumped)
+
     @property
     def get(self) -> SchemaModel | None:
         """Get the schema model.
@@ -71,6 +81,10 @@ class SchemaDefinition(BaseDefinition):
         Parameters:
           schema: A dictionary, or path to a dictionary or json file, conforming to the SchemaModel.
         """
+        if isinstance(schema, SchemaModel):
+            # The field CRUD takes the model's fields as they are, and may later set their constraints, so a model
+            # owned elsewhere (such as the schema of a loaded crosswalk) is detached first
+            schema = schema.copy(deep=True)
         self.model = self.core.create_or_update_model(modelType=SchemaModel, source=schema, model=self.model)
         self._refresh_model_fields()
 
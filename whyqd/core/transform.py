@@ -30,6 +30,8 @@ class TransformDefinition(BaseDefinition):
       ```
     """
 
+    __slots__ = ("reader", "data_source", "data", "crosswalk", "destination_mimetype", "destination_path")
+
     def __init__(
         self,
         *,
@@ -77,9 +79,11 @@ class TransformDefinition(BaseDefinition):
         elif data_source:
             if isinstance(data_source, DataSourceModel):
                 self.data_source = data_source
+                # The transform records the data source as it was set, detached from the caller's model
+                self._assign_model_value(field="dataSource", value=data_source.copy(deep=True))
             else:
                 self.data_source = self.core.create_or_update_model(modelType=DataSourceModel, source=data_source)
-            self.model.dataSource = self.data_source
+                self._assign_model_value(field="dataSource", value=self.data_source)
         if self.model.crosswalk and not crosswalk:
             self.crosswalk.set(crosswalk=self.model.crosswalk)
         elif crosswalk:
@@ -87,7 +91,8 @@ class TransformDefinition(BaseDefinition):
                 self.crosswalk = crosswalk
             else:
                 self.crosswalk.set(crosswalk=crosswalk)
-            self.model.crosswalk = self.crosswalk.get
+            # A detached copy, so later edits to the crosswalk definition don't rewrite the transform's provenance
+            self._assign_model_value(field="crosswalk", value=self.crosswalk.get.copy(deep=True))
 
     #########################################################################################
     # PERFORM TRANSFORMATION PROCESS
@@ -184,6 +189,13 @@ class TransformDefinition(BaseDefinition):
             raise ValueError(
                 f"Validation failed. Missing required destination fields in crosswalked data: {set(required_names) - set(crosswalk_df.columns)}"
             )
+        # Labels are compared as strings, as the checksum sees them, so `2019` and "2019" still match
+        same_columns = [str(c) for c in crosswalk_df.columns] == [str(c) for c in destination_df.columns]
+        if not same_columns or len(crosswalk_df) != len(destination_df):
+            # The checksum covers the header and every row, so a different shape can never match and isn't worth hashing
+            raise ValueError(
+                "Validation failed. Crosswalked data does not have the same columns and rows as the data destination."
+            )
         self.reader.get_checksum(df=crosswalk_df, crosscheck=self.model.dataDestination.checksum)
         return True
 
@@ -1,10 +1,16 @@
 from __future__ import annotations
-import modin.pandas as pd
+from typing import TYPE_CHECKING
 import numpy as np
 
 from whyqd.crosswalk.base import BaseSchemaAction
 from whyqd.models import ModifierModel, FieldModel
 
+if TYPE_CHECKING:
+    import modin.pandas as pd
+
+# numpy dtype kinds for float, signed and unsigned integer, and boolean columns
+NUMERIC_KINDS = frozenset("fiub")
+
 
 class Action(BaseSchemaAction):
     """Calculate the value of a field derived from the values of other fields. Requires a `MODIFIER` indicating whether
@@ -52,21 +58,29 @@ class Action(BaseSchemaAction):
         destination: FieldModel,
         source: list[FieldModel | ModifierModel],
     ) -> pd.DataFrame:
-        term_set = len(self.structure)
-        add_fields = [
-            field.name for modifier, field in self.core.chunks(lst=source, n=term_set) if modifier.name == "+"
-        ]
-        sub_fields = [
-            field.name for modifier, field in self.core.chunks(lst=source, n=term_set) if modifier.name == "-"
-        ]
-        for field in add_fields + sub_fields:
-            df[field] = df[field].apply(self.reader.parse_float)
+        add_fields, sub_fields = [], []
+        # Source terms alternate [modifier, field, ...], so pair them off without slicing
+        terms = iter(source)
+        for modifier, field in zip(terms, terms):
+            if modifier.name == "+":
+                add_fields.append(field.name)
+            elif modifier.name == "-":
+                sub_fields.append(field.name)
+        for field in dict.fromkeys(add_fields + sub_fields):
+            # Columns with a numeric (or boolean) dtype need no parsing
+            if df[field].dtype.kind not in NUMERIC_KINDS:
+                df[field] = self.reader.parse_float_column(column=df[field])
         # Need to maintain NaNs ... default is to treat NaNs as zeros, so even a sum of two NaNs is zero
         # If we don't know, we don't know ... but ... if a sum is mixed, then ignore the NaNs
-        _add = df[add_fields].sum(min_count=1, axis=1).array
-        _sub = df[sub_fields].sum(min_count=1, axis=1).array
-        # Need to use 'logical_and' since comparing NaNs is a disaster
-        df[destination.name] = np.where(
-            np.logical_and(np.isnan(_add), np.isnan(_sub)), np.nan, np.nan_to_num(_add) - np.nan_to_num(_sub)
-        )
+        # Single signed sum over all the terms, rather than separate sums for the added and subtracted fields
+        signs = np.array([1.0] * len(add_fields) + [-1.0] * len(sub_fields))
+        values = df[add_fields + sub_fields].to_numpy(dtype=np.float64, copy=False)
+        if values.shape[1] == 1:
+            # A single term, such as a change of sign, needs no reduction, and its NaNs carry through unchanged
+            df[destination.name] = values[:, 0] * signs[0]
+            return df
+        nans = np.isnan(values)
+        # Zero-filled matrix-vector product, so the signed row sums run as a single (multithreaded) BLAS call
+        totals = np.where(nans, 0.0, values) @ signs
+        df[destination.name] = np.where(nans.all(axis=1), np.nan, totals)
         return df
@@ -33,7 +33,8 @@ class Action(BaseMorphAction):
         destination_param: None = None,
     ) -> pd.DataFrame:
         # https://stackoverflow.com/a/51794989
-        # First remove all columns (axis=1) with no values
-        df = df.dropna(how="all", axis=1)
-        # Remove all rows (axis=0) with no values
-        return df.dropna(how="all", axis=0)
+        # A single null mask serves both reductions, since a row with no values across the remaining columns has none
+        # in the columns removed for having no values either
+        values = df.notna().to_numpy()
+        # Remove all columns (axis=1) with no values, then all rows (axis=0) with no values
+        return df.loc[:, values.any(axis=0)].loc[values.any(axis=1)]
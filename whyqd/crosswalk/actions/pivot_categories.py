@@ -1,11 +1,11 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
-import modin.pandas as pd
 import numpy as np
 
 from whyqd.crosswalk.base import BaseCategoryAction
 
 if TYPE_CHECKING:
+    import modin.pandas as pd
     from whyqd.models import FieldModel
 
 
@@ -61,7 +61,7 @@ class Action(BaseCategoryAction):
         self.title = "Pivot categories"
         self.description = "Convert row-level categories into field categorisations."
 
-    def parse(self, *, script: str) -> dict[str, str]:
+    def _parse_script(self, *, script: str) -> dict[str, str]:
         parsed = {}
         # Get unique assignment terms
         root = self.parser.get_split_terms(script=script, by="<")
@@ -95,15 +95,18 @@ class Action(BaseCategoryAction):
         category: None = None,
         assigned: list[int] | None = None,
     ) -> pd.DataFrame:
-        # Fix: Multiple arguments results in keyerror in Modin
-        df[destination.name] = None
+        # Categories are assigned to a positional array in one vectorised write per category row, and the column is
+        # set once, rather than scattering label-based `.loc` writes into the (Modin) dataframe
+        labels = df.index.to_numpy()
+        terms = df[source.name].to_numpy()
+        positions = df.index.get_indexer(assigned)
+        if (positions < 0).any():
+            raise ValueError(f"Category pivot rows are not in the data ({assigned}).")
+        categories = np.full(len(labels), None, dtype=object)
         for i, idx in enumerate(assigned):
-            to_idx = df.index[-1] + 1
+            to_idx = labels[-1] + 1
             if i + 1 < len(assigned):
                 to_idx = assigned[i + 1]
-            category_column = {k: v for k, v in df.loc[idx].items() if pd.notnull(v) and k == source.name}
-            # https://stackoverflow.com/a/46307319
-            idx_list = np.arange(idx + 1, to_idx)
-            # https://github.com/modin-project/modin/issues/4354
-            df.loc[df.index.intersection(idx_list), destination.name] = category_column[source.name]
+            categories[(labels > idx) & (labels < to_idx)] = terms[positions[i]]
+        df[destination.name] = categories
         return df.drop(assigned, errors="ignore")
@@ -63,14 +63,16 @@ class Action(BaseSchemaAction):
             # False if (test_date == nan) | (base_date == nan) | base_date >< test_date
             # Therefore we need to test again for the alternatives
             df[date.name] = df[date.name].apply(self.reader.parse_dates_coerced)
+            # Evaluate the date comparison once and reuse it for both the values and the base dates
+            keep_base = (df[date.name].isnull() | (df[base_date] > df[date.name])).to_numpy()
             df[destination.name] = np.where(
-                df[date.name].isnull() | (df[base_date] > df[date.name]),
+                keep_base,
                 np.where(df[destination.name].notnull(), df[destination.name], df[data.name]),
                 np.where(df[data.name].notnull(), df[data.name], df[destination.name]),
             )
             if base_date != destination.name:
                 df[base_date] = np.where(
-                    df[date.name].isnull() | (df[base_date] > df[date.name]),
+                    keep_base,
                     np.where(df[base_date].notnull(), df[base_date], df[date.name]),
                     np.where(df[date.name].notnull(), df[date.name], df[base_date]),
                 )
@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
-import numpy as np
 
 from whyqd.crosswalk.base import BaseMorphAction
 
@@ -70,8 +69,9 @@ class Action(BaseMorphAction):
             raise ValueError("SEPARATE action did not receive an expected separate-by parameter.")
         if len(source) != 1:
             raise ValueError("SEPARATE action should have only a single source field for separating.")
-        separate_array = np.array([x.split(source_param) for x in df[source[0].name].array.ravel()], dtype=object)
-        num_columns = max(map(len, separate_array))
+        # Split once, and take the number of columns from the expanded result
+        separated = self.core.split_column(column=df[source[0].name], by=source_param)
+        num_columns = separated.shape[1]
         if num_columns == 1:
             return df
         if not isinstance(destination, list) or num_columns != len(destination):
@@ -79,5 +79,6 @@ class Action(BaseMorphAction):
                 f"SEPARATE action needs to separate {num_columns} columns by received {len(destination)} for destination."
             )
         new_columns = [c.name for c in destination]
-        df[new_columns] = df[source[0].name].str.split(source_param, expand=True)
+        for i, column in enumerate(new_columns):
+            df[column] = separated[:, i]
         return df
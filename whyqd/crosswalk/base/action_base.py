@@ -1,10 +1,12 @@
 from __future__ import annotations
 from typing import List, Union, Optional, TYPE_CHECKING
 
+from whyqd.models import SchemaActionModel
 
 if TYPE_CHECKING:
     import modin.pandas as pd
-    from whyqd.models import ModifierModel, FieldModel, SchemaActionModel, ColumnModel
+    from whyqd.models import ModifierModel, FieldModel, ColumnModel
+    from whyqd.parsers import CoreParser, DataSourceParser
 
 
 class BaseSchemaAction:
@@ -26,11 +28,11 @@ class BaseSchemaAction:
     Where the structure of the source array is defined by the ACTION.
     """
 
-    def __init__(self) -> None:
-        from whyqd.parsers import CoreParser, DataSourceParser
+    # Parsers are only instantiated on first use, since most actions are created only to be validated
+    _reader = None
+    _core = None
 
-        self.reader = DataSourceParser()
-        self.core = CoreParser()
+    def __init__(self) -> None:
         self.name = ""
         self.title = ""
         self.description = ""
@@ -39,6 +41,22 @@ class BaseSchemaAction:
         # additional terms will require overriding the `has_valid_structure` function
         self.structure = []
 
+    @property
+    def reader(self) -> DataSourceParser:
+        if self._reader is None:
+            from whyqd.parsers import DataSourceParser
+
+            self._reader = DataSourceParser()
+        return self._reader
+
+    @property
+    def core(self) -> CoreParser:
+        if self._core is None:
+            from whyqd.parsers import CoreParser
+
+            self._core = CoreParser()
+        return self._core
+
     @property
     def modifiers(self) -> Union[None, List[ModifierModel]]:
         """
@@ -98,8 +116,6 @@ class BaseSchemaAction:
         dict
             Dict representation of an Action.
         """
-        from whyqd.models import SchemaActionModel
-
         action_settings = {
             "name": self.name,
             "title": self.title,
@@ -1,12 +1,15 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
+from functools import lru_cache
+import pandas as _pd
 import modin.pandas as pd
 import numpy as np
 
+from whyqd.models import CategoryActionModel
 from whyqd.parsers import DataSourceParser, ScriptParser
 
 if TYPE_CHECKING:
-    from whyqd.models import CategoryActionModel, CategoryModel, FieldModel
+    from whyqd.models import CategoryModel, FieldModel
 
 
 class BaseCategoryAction:
@@ -27,14 +30,28 @@ class BaseCategoryAction:
     Where the structure of the source array is defined by the ACTION.
     """
 
+    # Parsers are only instantiated on first use, since most actions are created only to be validated
+    _reader = None
+    _parser = None
+
     def __init__(self) -> None:
-        self.reader = DataSourceParser()
-        self.parser = ScriptParser()
         self.name = ""
         self.title = ""
         self.description = ""
         self.structure = []
 
+    @property
+    def reader(self) -> DataSourceParser:
+        if self._reader is None:
+            self._reader = DataSourceParser()
+        return self._reader
+
+    @property
+    def parser(self) -> ScriptParser:
+        if self._parser is None:
+            self._parser = ScriptParser()
+        return self._parser
+
     @property
     def settings(self) -> CategoryActionModel:
         """
@@ -45,8 +62,6 @@ class BaseCategoryAction:
         CategoryActionModel
             CategoryActionModel representation of an Action.
         """
-        from whyqd.models import CategoryActionModel
-
         action_settings = {
             "name": self.name,
             "title": self.title,
@@ -87,6 +102,13 @@ class BaseCategoryAction:
         dict
             Parsed dictionary of validated split strings for further processing.
         """
+        # The same scripts are re-parsed repeatedly while a crosswalk is built and validated, and actions are created
+        # afresh for each script, so split terms are cached per action class on the raw script. Lists, such as the
+        # pivot row terms, are copied so that callers can't mutate the cached values.
+        parsed = _parse_script_cached(type(self), script)
+        return {k: list(v) if isinstance(v, list) else v for k, v in parsed.items()}
+
+    def _parse_script(self, *, script: str) -> dict[str, str]:
         parsed = {}
         # Get unique assignment terms
         root = self.parser.get_split_terms(script=script, by="<")
@@ -159,45 +181,48 @@ class BaseCategoryAction:
             # Conditions are contingent on values in a column
             # If assigned is `True`, then values are `True`, else values are `False` and nulls are `True`
             if source.dtype and source.dtype not in ["string", "object"]:
-                conditions = self.reader.coerce_column_to_dtype(column=df[source.name], coerce=source.dtype)
-                if conditions.dtype in ["float64", "int64", "Float64", "Int64"]:
-                    conditions = conditions.replace({0: np.nan})
-                if conditions.dtype in ["datetime64[ns]"]:
-                    conditions = conditions.apply(self.reader.parse_dates_coerced)
-            if assigned[0].name:
-                # i.e. values are assigned True
-                conditions = pd.Series([not (pd.isnull(x) or not x) for x in conditions.tolist()])
+                # Numeric zeros need no replacing with NaN, since they are already falsy in the truthiness test below,
+                # and datetimes need no re-parsing, since only their nulls (already NaT) are falsy
+                conditions = self.reader.coerce_column_to_dtype(column=conditions, coerce=source.dtype)
+            # Truthiness is tested on the raw values in a single vectorised pass
+            values = conditions.to_numpy()
+            nulls = _pd.isnull(values)
+            if values.dtype.kind in "mM":
+                # Any valid date is truthy
+                conditions = ~nulls
             else:
+                # Nulls are masked out first, since some (e.g. NA) have no truth value
+                conditions = ~nulls & np.where(nulls, False, values).astype(bool)
+            if not assigned[0].name:
                 # i.e. values are assigned False
-                conditions = pd.Series([(pd.isnull(x) or not x) for x in conditions.tolist()])
+                conditions = ~conditions
         else:
-            # The conditional column values are categorised directly
-            conditions = conditions.isin([c.name for c in assigned])
+            # The conditional column values are categorised directly, as a numpy mask like the boolean conditions
+            conditions = conditions.isin([c.name for c in assigned]).to_numpy()
         # Array-based categorisation adds additional terms to existing columns
         if destination.dtype == "array":
-            new_column = []
+            terms = np.where(conditions, category.name, default).tolist() if len(conditions) else []
             if destination.name in df.columns:
-                new_column = [df[destination.name].tolist()]
-            if destination.dtype == "array" and not conditions.empty:
-                new_column.append(
-                    [
-                        [x] if not isinstance(x, list) else x
-                        for x in np.where(conditions, category.name, default).tolist()
-                    ]
-                )
-            # Sorted to avoid hashing errors later ...
-            if len(new_column) > 1:
-                # Moving sorting to the hashing function so we can maintain None's for ordered lists
-                # Permits reconstruction of datasets using array transformations
-                # https://stackoverflow.com/a/18411610
-                # new_column = [sorted(list(set([c for clist in x for c in clist])), key=lambda x: (x is None, x)) for x in zip(*new_column)]
-                new_column = [[c for clist in x for c in clist] for x in zip(*new_column)]
+                existing = df[destination.name].tolist()
+                if terms:
+                    # Moving sorting to the hashing function so we can maintain None's for ordered lists
+                    # Permits reconstruction of datasets using array transformations
+                    # https://stackoverflow.com/a/18411610
+                    # Append the new term to the existing terms of each row, without re-flattening every row
+                    new_column = [[*row, term] for row, term in zip(existing, terms)]
+                else:
+                    new_column = [[x] if not isinstance(x, list) else x for x in existing]
             else:
-                new_column = [[x] if not isinstance(x, list) else x for x in new_column[0]]
-            # for n in new_column:
-            #     if None in n:
-            #         n.remove(None)
+                new_column = [[term] for term in terms]
             df[destination.name] = new_column
+        elif destination.name in df.columns and not conditions.any():
+            # Nothing is assigned, and the existing values are the default, so the column is left as it is
+            return df
         else:
             df[destination.name] = np.where(conditions, category.name, default)
         return df
+
+
+@lru_cache(maxsize=1024)
+def _parse_script_cached(action: type[BaseCategoryAction], script: str) -> dict[str, str]:
+    return action()._parse_script(script=script)
@@ -37,8 +37,10 @@ class BaseMorphAction:
     * `rows` are indicated by `<`.
     """
 
+    # Only instantiated on first use, since most morphs are created only to be validated
+    _core = None
+
     def __init__(self) -> None:
-        self.core = CoreParser()
         self.name = ""
         self.title = ""
         self.description = ""
@@ -47,6 +49,12 @@ class BaseMorphAction:
         # Where new columns are created, these will be randomly-generated and can be renamed as required.
         self.structure = []
 
+    @property
+    def core(self) -> CoreParser:
+        if self._core is None:
+            self._core = CoreParser()
+        return self._core
+
     @property
     def settings(self) -> MorphActionModel:
         """
@@ -112,4 +120,4 @@ class BaseMorphAction:
         return df.rename(index=str, columns=renames)
 
     def _generate_hex(self):
-        return str(uuid4().hex)[:4]
+        return uuid4().hex[:4]
@@ -62,10 +62,11 @@ class CRUDAction(CRUDBase[ActionScriptModel]):
         Returns:
           An ActionScriptModel or None, of no such script is found.
         """
-        uid = self.get_hex(name=name)
-        if self.multi:
-            return next((m for m in self.multi if m.uuid.hex == uid), None)
-        return None
+        return self.multi_index.get(self.get_hex(name=name))
+
+    def _index_keys(self, *, term: ActionScriptModel) -> list[str]:
+        """Scripts may be duplicated, so only the UUID is indexed."""
+        return [term.uuid.hex]
 
     def add(self, *, term: str | ActionScriptModel) -> None:
         """Add the string term for an action script. Validate as well. Does not test for uniqueness.
@@ -83,12 +84,24 @@ class CRUDAction(CRUDBase[ActionScriptModel]):
             if isinstance(term, dict):
                 term = ActionScriptModel(**term)
             parsed = self.parse(script=term.script)
-            self.multi.append(term)
         else:
             parsed = self.parse(script=term)
-            self.multi.append(ActionScriptModel(**{"script": term}))
+            term = ActionScriptModel(**{"script": term})
+        self._append_term(term=term)
         self.reconcile_crosswalk(fields=parsed.get("destination", []))
 
+    def add_multi(self, *, terms: list[str | ActionScriptModel]) -> None:
+        """Add multiple string terms for action scripts. Validate as well. Does not test for uniqueness.
+
+        Parameters:
+          terms: A list of string terms, or ActionScriptModels, conforming to the script structure for specific actions.
+
+        Raises:
+          ValueError: If any script is invalid.
+        """
+        for term in terms:
+            self.add(term=term)
+
     def update(self, *, term: ActionScriptModel | dict) -> None:
         """Update the parameters for a specific term, called by a unique `UUID`. If the `UUID` does not exist, then this
         will raise a `ValueError`.
@@ -122,8 +135,7 @@ class CRUDAction(CRUDBase[ActionScriptModel]):
         script = self.get(name=name)
         if script:
             parsed = self.parse(script=script)
-            # https://stackoverflow.com/a/1235631/295606
-            self.multi[:] = [m for m in self.multi if m.uuid.hex != script.uuid.hex]
+            self._remove_term(term=script)
             self.reconcile_crosswalk(fields=parsed.get("destination", []), remove=True)
 
     def parse(self, *, script: str | ActionScriptModel) -> dict:
@@ -164,12 +176,17 @@ class CRUDAction(CRUDBase[ActionScriptModel]):
           }
           ```
         """
+        return self._parse(script=script)[1]
+
+    def _parse(self, *, script: str | ActionScriptModel) -> tuple[ActionParser | MorphParser | CategoryParser, dict]:
+        """Parse a script, returning both the action parser used and the parsed dictionary, so that a transform can
+        reuse the parser rather than build and set up another."""
         if isinstance(script, ActionScriptModel):
             script = script.script
         action = self.get_action(script=script)
         action_parser = self.get_action_parser(script=script, action=action)()
         action_parser.set_schema(schema_source=self.schema_source, schema_destination=self.schema_destination)
-        return action_parser.parse(script=script, action=action)
+        return action_parser, action_parser.parse(script=script, action=action)
 
     def validate(self, *, required: bool = False) -> list[FieldModel]:
         """Return the list of destination schema fields which are still to be crosswalked.
@@ -180,13 +197,16 @@ class CRUDAction(CRUDBase[ActionScriptModel]):
         Returns:
           List of FieldModels which are required but are still undefined by an ActionScriptModel.
         """
+        if not self.uncrossed:
+            # Fully crosswalked, so no need to walk the destination fields
+            return []
         if required:
             return [
                 f
-                for f in self.schema_destination.get.fields
+                for f in self.schema_destination.fields.get_all()
                 if f.uuid in self.uncrossed and f.constraints and f.constraints.required
             ]
-        return [f for f in self.schema_destination.get.fields if f.uuid in self.uncrossed]
+        return [f for f in self.schema_destination.fields.get_all() if f.uuid in self.uncrossed]
 
     ###################################################################################################
     ### TABULAR DATA TRANSFORMATION UTILITIES
@@ -202,9 +222,7 @@ class CRUDAction(CRUDBase[ActionScriptModel]):
         Returns:
           Transformed dataframe.
         """
-        parsed = self.parse(script=script)
-        action_parser = self.get_action_parser(script=script, action=parsed["action"])()
-        action_parser.set_schema(schema_source=self.schema_source, schema_destination=self.schema_destination)
+        action_parser, parsed = self._parse(script=script)
         return action_parser.transform(df=df, **parsed)
 
     def transform_all(self, *, df: pd.DataFrame) -> pd.DataFrame:
@@ -237,7 +255,7 @@ class CRUDAction(CRUDBase[ActionScriptModel]):
             raise ValueError("Schema for both source and destination has not been provided.")
         self.schema_source = schema_source
         self.schema_destination = schema_destination
-        self.uncrossed = {field.uuid for field in self.schema_destination.get.fields}
+        self.uncrossed = {field.uuid for field in self.schema_destination.fields.get_all()}
 
     def get_action(self, *, script: str) -> BaseSchemaAction | BaseMorphAction | BaseCategoryAction:
         """Return the first action term from a script as its Model type.
@@ -287,7 +305,8 @@ class CRUDAction(CRUDBase[ActionScriptModel]):
         if not isinstance(fields, list):
             fields = [fields]
         for f in fields:
+            # Update in place, rather than building a new set for every field
             if remove:
-                self.uncrossed = self.uncrossed ^ {f.uuid}
+                self.uncrossed ^= {f.uuid}
             else:
-                self.uncrossed = self.uncrossed - {f.uuid}
+                self.uncrossed.discard(f.uuid)
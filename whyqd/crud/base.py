@@ -17,6 +17,63 @@ class CRUDBase(Generic[ModelType]):
     def __init__(self, model: Type[ModelType]):
         self.model = model
         self.multi = []
+        # Lookup of terms by `uuid.hex` and `name`, kept in concord with `multi`
+        self.multi_index = {}
+        # Lookup of list positions by `uuid.hex`, rebuilt on demand after a removal or reorder
+        self.multi_position = None
+
+    def _index_keys(self, *, term: ModelType) -> list[str]:
+        """Keys by which a term can be recovered from the index."""
+        return [term.uuid.hex, term.name]
+
+    def _index_term(self, *, term: ModelType) -> None:
+        for key in self._index_keys(term=term):
+            self.multi_index[key] = term
+
+    def _reindex_terms(self) -> None:
+        """Rebuild the index from `multi`, picking up any terms renamed directly since they were indexed."""
+        self.multi_index = {}
+        for term in self.multi:
+            self._index_term(term=term)
+
+    def _unindex_term(self, *, term: ModelType) -> None:
+        for key in self._index_keys(term=term):
+            if self.multi_index.get(key) is term:
+                del self.multi_index[key]
+
+    def _get_position(self, *, term: ModelType) -> int:
+        if self.multi_position is None:
+            self.multi_position = {m.uuid.hex: i for i, m in enumerate(self.multi)}
+        return self.multi_position[term.uuid.hex]
+
+    def _append_term(self, *, term: ModelType) -> None:
+        if self.multi_position is not None:
+            self.multi_position[term.uuid.hex] = len(self.multi)
+        self.multi.append(term)
+        self._index_term(term=term)
+
+    def _patch_term(self, *, term: ModelType, patch: ModelType) -> None:
+        old_uid = term.uuid.hex
+        self._unindex_term(term=term)
+        # The patch has already been validated as a whole, so assign its values directly rather than through
+        # `setattr`, which would validate each of them again under `validate_assignment`
+        for key in patch.__fields_set__:
+            term.__dict__[key] = getattr(patch, key)
+        term.__fields_set__.update(patch.__fields_set__)
+        self._index_term(term=term)
+        if self.multi_position is not None and term.uuid.hex != old_uid:
+            self.multi_position[term.uuid.hex] = self.multi_position.pop(old_uid)
+
+    def _remove_term(self, *, term: ModelType) -> None:
+        position = self._get_position(term=term)
+        del self.multi[position]
+        self._unindex_term(term=term)
+        if position == len(self.multi):
+            # Removed from the end, so no other positions have shifted
+            del self.multi_position[term.uuid.hex]
+        else:
+            # Subsequent positions have all shifted
+            self.multi_position = None
 
     def get(self, *, name: str | UUID) -> ModelType | None:
         """Get a specific model from the list of models defining this schema, called by a unique `name`.
@@ -28,11 +85,17 @@ class CRUDBase(Generic[ModelType]):
           ModelType, or None if no such `name` or `UUID`.
         """
         name = self.get_hex(name=name)
-        if self.multi:
-            # https://stackoverflow.com/a/31988734/295606
-            # It is statistically almost impossible to have a field name that matches a randomly-generated UUID
-            # Can be used to recover fields from hex
-            return next((m for m in self.multi if m.name == name or m.uuid.hex == name), None)
+        # It is statistically almost impossible to have a field name that matches a randomly-generated UUID
+        # Can be used to recover fields from hex
+        term = self.multi_index.get(name)
+        if term is not None and name in self._index_keys(term=term):
+            return term
+        # Terms are mutable, so one renamed directly (rather than through `update`) is only found by a scan, and is
+        # then re-indexed
+        for term in self.multi:
+            if name in self._index_keys(term=term):
+                self._index_term(term=term)
+                return term
         return None
 
     def get_all(self) -> list[ModelType]:
@@ -51,10 +114,14 @@ class CRUDBase(Generic[ModelType]):
           ValueError: If the term already exists.
         """
         if isinstance(term, dict):
+            # Fail on a duplicate name before paying for validation of the full model
+            name = term.get("name")
+            if isinstance(name, str) and self.get(name=name):
+                raise ValueError(f"ModelType {name} already exists.")
             term = self.model(**term)
         if self.get(name=term.name):
             raise ValueError(f"ModelType {term.name} already exists.")
-        self.multi.append(term)
+        self._append_term(term=term)
 
     def add_multi(self, *, terms: list[ModelType | dict]) -> None:
         """Add multiple parameters for a specific term, called by a unique `name`. If the `name` already exists, then
@@ -66,8 +133,18 @@ class CRUDBase(Generic[ModelType]):
         Raises:
           ValueError: If the term already exists.
         """
+        terms = [self.model(**term) if isinstance(term, dict) else term for term in terms]
+        # Check all duplicates at once, before any terms are added, against an index which includes renamed terms
+        names = [term.name for term in terms]
+        self._reindex_terms()
+        # Intersect with the index keys in C, and only confirm the (rare) hits with a full lookup
+        duplicates = {name for name in self.multi_index.keys() & set(names) if self.get(name=name)}
+        if len(set(names)) != len(names):
+            duplicates |= {name for name in names if names.count(name) > 1}
+        if duplicates:
+            raise ValueError(f"ModelType {', '.join(sorted(map(str, duplicates)))} already exists.")
         for term in terms:
-            self.add(term=term)
+            self._append_term(term=term)
 
     def update(self, *, term: ModelType | dict) -> None:
         """Update the parameters for a specific term, called by a unique `name`. If the `name` does not exist, then
@@ -85,12 +162,10 @@ class CRUDBase(Generic[ModelType]):
         old_term = self.get(name=term.name)
         if not old_term:
             raise ValueError(f"ModelType {term.name} does not exist.")
-        # And update the original data
-        old_name = old_term.name
+        # And update the original data in place, retaining its position in the list. Only the explicitly set
+        # attributes are assigned, so the term is mutated rather than copied.
         # https://fastapi.tiangolo.com/tutorial/body-updates/#partial-updates-with-patch
-        old_term = old_term.copy(update=term.dict(exclude_unset=True))
-        self.remove(name=old_name)
-        self.add(term=old_term)
+        self._patch_term(term=old_term, patch=term)
 
     def remove(self, *, name: str) -> None:
         """Remove a specific term, called by a unique `name`.
@@ -98,28 +173,37 @@ class CRUDBase(Generic[ModelType]):
         Parameters:
           name: Specific name or reference UUID for a field already in the Schema.
         """
-        # https://stackoverflow.com/a/1235631/295606
-        name = self.get_hex(name=name)
-        self.multi[:] = [m for m in self.multi if m.name != name and m.uuid.hex != name]
+        term = self.get(name=name)
+        if term is not None:
+            self._remove_term(term=term)
 
     def reset(self) -> None:
         """Reset a list of ModelType terms to an empty list."""
         self.multi = []
+        self.multi_index = {}
+        self.multi_position = None
 
     def reorder(self, *, order: list[UUID]) -> None:
         """Reorder a list of terms.
 
         Parameters:
-          order: list of UUID in the desired order. Use `.get_all()` to view the current list.
+          order: list of UUID, or UUID strings, in the desired order. Use `.get_all()` to view the current list.
 
         Raises:
           ValueError: If the list of `UUIDs` doesn't conform to that in the list of terms.
         """
-        order = [self.get_hex(name=o) for o in order]
-        if {m.uuid.hex for m in self.multi}.difference(set(order)):
+        if len(order) != len(self.multi):
+            raise ValueError("List of reordered term ids isn't the same as that in the provided list of Models.")
+        # UUIDs are used as-is, while string references in any valid UUID format are parsed only once
+        rank = {(o.hex if isinstance(o, UUID) else UUID(o).hex): i for i, o in enumerate(order)}
+        if rank.keys() != {m.uuid.hex for m in self.multi}:
             raise ValueError("List of reordered term ids isn't the same as that in the provided list of Models.")
-        if self.multi:
-            self.multi = sorted(self.multi, key=lambda term: order.index(term.uuid.hex))
+        # Each term's rank is its final position, so place terms directly rather than sorting
+        ordered = [None] * len(self.multi)
+        for term in self.multi:
+            ordered[rank[term.uuid.hex]] = term
+        self.multi[:] = ordered
+        self.multi_position = rank
 
     def get_hex(self, *, name: str | UUID) -> str:
         if isinstance(name, UUID):
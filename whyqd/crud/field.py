@@ -98,24 +98,33 @@ class CRUDField(CRUDBase[FieldModel]):
             raise ValueError(f"FieldModel {name} does not exist in the schema.")
         return field.constraints
 
-    def set_constraints(self, *, name: str | UUID, constraints: ConstraintsModel | None) -> None:
+    def set_constraints(self, *, name: str | UUID, constraints: ConstraintsModel | dict | None) -> None:
         """Set the constraint parameters for a specific field to define this schema, called by a unique
         `name` already in the schema.
 
         Parameters:
           name: Specific name or reference UUID for a field already in the Schema
-          constraints: A dictionary conforming to the ConstraintsModel, or None. If None, then constraints are deleted.
+          constraints: A ConstraintsModel, or dictionary conforming to it, or None. If None, then constraints are deleted.
         """
-        old_constraints = self.get_constraints(name=name)
+        field = self.get(name=name)
+        if not field:
+            raise ValueError(f"FieldModel {name} does not exist in the schema.")
+        old_constraints = field.constraints
         if not constraints:
             old_constraints = None
         else:
-            new_constraints = ConstraintsModel(**constraints)
+            # Already-validated models are used as-is, rather than being rebuilt
+            new_constraints = constraints
+            if not isinstance(constraints, ConstraintsModel):
+                new_constraints = ConstraintsModel(**constraints)
             if old_constraints:
-                old_constraints = old_constraints.copy(update=new_constraints.dict(exclude_unset=True))
+                # Merge only the explicitly set keys, keeping nested category models as models
+                old_constraints = old_constraints.copy(
+                    update={k: getattr(new_constraints, k) for k in new_constraints.__fields_set__}
+                )
             else:
                 old_constraints = new_constraints
-        self.get(name=name).constraints = old_constraints
+        field.constraints = old_constraints
 
     def set_categories(
         self,
@@ -135,26 +144,39 @@ class CRUDField(CRUDBase[FieldModel]):
           has_array:  Set `True` if data terms are arrays, or the Field is of type `FieldType.ARRAY`
         """
         field = self.get(name=name)
+        if as_bool:
+            self._set_boolean_categories(field=field)
+            return
         if not field.constraints:
             field.constraints = ConstraintsModel()
-        if as_bool:
-            field.constraints.category = [CategoryModel(**{"name": term}) for term in [True, False]]
-        else:
-            if not isinstance(terms, list):
-                terms = terms[name].unique()
-            if has_array or field.dtype == FieldType.ARRAY:
-                # Multiple categories in a row
-                field.dtype = FieldType.ARRAY
-                # This will only work where it's a 2D array, which it 'should' be
-                # https://stackoverflow.com/a/38900498/295606
-                terms = [
-                    x for inner in [[item] if not isinstance(item, list) else item for item in terms] for x in inner
-                ]
-            field.constraints.category = [
-                CategoryModel(**{"name": term})
-                for term in terms
-                if not (term is pd.NA or pd.isnull(term) or term is None)
-            ]
+        if not isinstance(terms, list):
+            # Drop nulls column-wise before deriving the unique terms
+            terms = terms[name].dropna().unique()
+        if has_array or field.dtype == FieldType.ARRAY:
+            # Multiple categories in a row
+            field.dtype = FieldType.ARRAY
+            # This will only work where it's a 2D array, which it 'should' be
+            # https://stackoverflow.com/a/38900498/295606
+            # Flattened terms repeat across rows, so deduplicate as they're collected, preserving order
+            terms = dict.fromkeys(x for item in terms for x in (item if isinstance(item, list) else [item])).keys()
+        field.constraints.category = [
+            CategoryModel(**{"name": term}) for term in terms if not (term is pd.NA or pd.isnull(term) or term is None)
+        ]
+
+    def _set_boolean_categories(self, *, field: FieldModel, set_default: bool = False) -> None:
+        """Set `True` and `False` categories on a field, retaining any other constraints already set. Each field gets
+        its own category models, since category UUIDs must be unique."""
+        # TODO: put this somewhere more useful, and where the user can set default is True/False
+        categories = [CategoryModel(**{"name": term}) for term in (True, False)]
+        if not field.constraints:
+            constraints = {"enum": categories}
+            if set_default:
+                constraints["default"] = categories[0]
+            field.constraints = ConstraintsModel(**constraints)
+            return
+        field.constraints.category = categories
+        if set_default and not field.constraints.default:
+            field.constraints.default = categories[0]
 
     def get_category(self, *, name: str, category: bool | str) -> CategoryModel | None:
         """Get a specific field from the list of fields defining this schema, called by a unique `name`.
@@ -170,16 +192,16 @@ class CRUDField(CRUDBase[FieldModel]):
           A list of CategoryModel, or None of none are defined.
         """
         if self.multi:
-            field_categories = self.get_constraints(name=name)
-            if not field_categories and isinstance(category, bool):
+            field = self.get(name=name)
+            if not field:
+                raise ValueError(f"FieldModel {name} does not exist in the schema.")
+            if isinstance(category, bool) and (
+                not field.constraints or (field.dtype == FieldType.BOOLEAN and not field.constraints.category)
+            ):
                 # Bools have default True, False categories
-                # Create them now if they don't exist
-                # TODO: put this somewhere more useful, and where the user can set default is True/False
-                true = CategoryModel(**{"name": True})
-                false = CategoryModel(**{"name": False})
-                fld = self.get(name=name)
-                fld.constraints = ConstraintsModel(**{"default": true, "enum": [true, false]})
-            field_categories = self.get_constraints(name=name).category
+                # Create them now if they don't exist, retaining any other constraints already set on a boolean field
+                self._set_boolean_categories(field=field, set_default=True)
+            field_categories = field.constraints.category if field.constraints else None
             if not field_categories:
                 raise ValueError(f"Field ({name}) has no `category` constraints.")
             # https://stackoverflow.com/a/31988734/295606
@@ -1,3 +1,3 @@
 from .status import StatusType
 from .mime import MimeType
-from .field import FieldType
\ No newline at end of file
+from .field import FieldType, NUMERIC_DTYPES, DATETIME_DTYPES
@@ -17,8 +17,8 @@ class MimeType(str, Enum):
         # Allows:
         #   `MimeType.value_of("prq")`
         #   <MimeType.PARQUET: 'application/vnd.apache.parquet'>
-        for k, v in cls.__members__.items():
-            if k.upper() == value.upper():
-                return v
-        else:
+        # Member names are all uppercase, so a direct lookup replaces scanning the members
+        member = cls.__members__.get(value.upper())
+        if member is None:
             raise ValueError(f"'{cls.__name__}' enum not found for '{value}'")
+        return member
@@ -1,6 +1,24 @@
 from enum import Enum
 
 
+# Shared across all members, rather than rebuilt on every call to `describe`
+STATUS_TYPE_DESCRIPTIONS = {
+    "waiting": "Waiting ...",
+    "processing": "Processing ...",
+    "ready_merge": "Ready to Merge",
+    "ready_structure": "Ready to Structure",
+    "ready_categorise": "Ready to Categorise",
+    "ready_filter": "Ready to Filter",
+    "ready_transform": "Ready to Transform",
+    "create_error": "Create Error",
+    "merge_error": "Merge Error",
+    "structure_error": "Structure Error",
+    "category_error": "Categorisation Error",
+    "transform_error": "Transform Error",
+    "process_complete": "Process Complete",
+}
+
+
 class StatusType(str, Enum):
     WAITING = "waiting"
     PROCESSING = "processing"
@@ -18,19 +36,4 @@ class StatusType(str, Enum):
 
     @property
     def describe(self):
-        description = {
-            "waiting": "Waiting ...",
-            "processing": "Processing ...",
-            "ready_merge": "Ready to Merge",
-            "ready_structure": "Ready to Structure",
-            "ready_categorise": "Ready to Categorise",
-            "ready_filter": "Ready to Filter",
-            "ready_transform": "Ready to Transform",
-            "create_error": "Create Error",
-            "merge_error": "Merge Error",
-            "structure_error": "Structure Error",
-            "category_error": "Categorisation Error",
-            "transform_error": "Transform Error",
-            "process_complete": "Process Complete",
-        }
-        return description[self.value]
+        return STATUS_TYPE_DESCRIPTIONS[self.value]
@@ -2,7 +2,7 @@ from __future__ import annotations
 from pydantic import BaseModel, Field, validator
 from uuid import UUID, uuid4
 
-from whyqd.dtypes import FieldType
+from whyqd.dtypes import FieldType, NUMERIC_DTYPES, DATETIME_DTYPES
 
 
 class ColumnModel(BaseModel):
@@ -27,8 +27,8 @@ class ColumnModel(BaseModel):
 
     @validator("dtype", pre=True, always=True)
     def generate_dtype(cls, v):
-        if v in ["float64", "int64", "Float64", "Int64", FieldType.NUMBER.value]:
+        if v in NUMERIC_DTYPES or v == FieldType.NUMBER.value:
             return FieldType.NUMBER
-        if v in ["datetime64[ns]", FieldType.DATETIME.value]:
+        if v in DATETIME_DTYPES or v == FieldType.DATETIME.value:
             return FieldType.DATETIME
         return FieldType.STRING
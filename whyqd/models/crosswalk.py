@@ -4,6 +4,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from whyqd.models import CitationModel, ActionScriptModel, SchemaModel, VersionModel
+from whyqd.models.schema import NAME_SPACE_TABLE
 
 
 class CrosswalkModel(BaseModel):
@@ -39,4 +40,4 @@ class CrosswalkModel(BaseModel):
 
     @validator("name")
     def name_space(cls, v):
-        return "_".join(v.split(" ")).lower()
+        return v.translate(NAME_SPACE_TABLE).lower()
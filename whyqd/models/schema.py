@@ -6,6 +6,9 @@ from uuid import UUID, uuid4
 from whyqd.models import FieldModel, VersionModel, CitationModel
 
 
+NAME_SPACE_TABLE = str.maketrans(" ", "_")
+
+
 class SchemaModel(BaseModel):
     uuid: UUID = Field(default_factory=uuid4, description="Automatically generated unique identity for the schema.")
     name: constr(strip_whitespace=True, to_lower=True) = Field(
@@ -42,7 +45,7 @@ class SchemaModel(BaseModel):
 
     @validator("name")
     def name_space(cls, v):
-        return "_".join(v.split(" ")).lower()
+        return v.translate(NAME_SPACE_TABLE).lower()
 
     @validator("fields")
     def are_fields_unique(cls, v):
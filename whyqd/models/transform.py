@@ -4,6 +4,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from whyqd.models import CitationModel, DataSourceModel, CrosswalkModel, VersionModel
+from whyqd.models.schema import NAME_SPACE_TABLE
 
 
 class TransformModel(BaseModel):
@@ -39,4 +40,4 @@ class TransformModel(BaseModel):
 
     @validator("name")
     def name_space(cls, v):
-        return "_".join(v.split(" ")).lower()
+        return v.translate(NAME_SPACE_TABLE).lower()
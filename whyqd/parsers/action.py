@@ -86,7 +86,7 @@ class ActionParser:
         if len(root) > 1:
             source = "<".join(root[1:])
         # Process initial response
-        if action.settings.name == "NEW":
+        if action.name == "NEW":
             # Special case where value is assigned as default to 'destination' field
             value = self.parser.get_literal(text=root[1])
             if len(value) > 1:
@@ -94,16 +94,14 @@ class ActionParser:
             destination.constraints = ConstraintsModel(**{"default": {"name": value[0]}})
             return {"action": action, "destination": destination}
         if not source:
-            if action.settings.structure:
+            if action.structure:
                 # The structure for this action requires a source term
-                raise ValueError(
-                    f"{action.name} action requires a source term ({action.settings.structure}) but none found."
-                )
+                raise ValueError(f"{action.name} action requires a source term ({action.structure}) but none found.")
             return {"action": action, "destination": destination}
         # If action does not include a structure, then no source term should be included
-        if not action.settings.structure:
+        if not action.structure:
             # The structure for this action requires a source term
-            raise ValueError(f"{action.settings.name} action does not include a source term but one found ({source}).")
+            raise ValueError(f"{action.name} action does not include a source term but one found ({source}).")
         # Source exists *and* and is required, process the second part
         # Nested sources must not have destinations as these will be autogenerated
         last_i = None
@@ -246,7 +244,7 @@ class ActionParser:
         from whyqd.crosswalk.actions import default_actions
 
         # Changes fields to uuid hexes
-        all_fields = [field for s in self.schema for field in s.get.fields]
+        all_fields = [field for s in self.schema for field in s.fields.get_all()]
         script = self.parser.get_hexed_script(script=script, fields=all_fields)
         self.modifier_names = set()
         self.source_modifiers = {}
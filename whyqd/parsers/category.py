@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import Type, TYPE_CHECKING
-import modin.pandas as pd
 
 from whyqd.parsers import CoreParser, ScriptParser
 from whyqd.models import CategoryModel
@@ -9,6 +8,7 @@ if TYPE_CHECKING:
     from whyqd.models import FieldModel, CategoryActionModel
     from whyqd.core import SchemaDefinition
     from whyqd.crosswalk.base import BaseCategoryAction
+    import modin.pandas as pd
 
 
 class CategoryParser:
@@ -93,8 +93,14 @@ class CategoryParser:
                 assigned = []
                 failed = []
                 assigned_uniques = self.get_assigned_uniques(text=parsed["source_category"])
+                # Resolve terms against the source field categories by name or hex in a single lookup, only falling
+                # back to the full (disambiguating) search for terms not found there
+                source_categories = {c.name: c for c in all_uniques}
+                source_categories.update({c.uuid.hex: c for c in all_uniques})
                 for c in assigned_uniques:
-                    category = self.get_schema_field_category(field=source, term=c, is_source=True)
+                    category = source_categories.get(c)
+                    if not category:
+                        category = self.get_schema_field_category(field=source, term=c, is_source=True)
                     if category:
                         assigned.append(category)
                     elif not category and isinstance(c, bool) and len(assigned_uniques) == 1:
@@ -106,7 +112,8 @@ class CategoryParser:
                         failed.append(c)
                     if failed:
                         raise ValueError(f"Assigned category not found in source field categories {set(failed)}.")
-                unassigned = [c for c in all_uniques if c.uuid.hex not in assigned_uniques]
+                assigned_hexes = set(assigned_uniques)
+                unassigned = [c for c in all_uniques if c.uuid.hex not in assigned_hexes]
             else:
                 assigned = parsed["source_category"]
         # Get destination column and assigned category term
@@ -209,19 +216,15 @@ class CategoryParser:
             alt_schema = self.schema_destination
         category = schema.fields.get_category(name=field.uuid.hex, category=term)
         # Disambiguation step ...
-        if not category:
-            # Any schema field
-            for schema_field in schema.fields.get_all():
+        # Match directly against the categories of the fields in hand, rather than re-fetching each field by UUID
+        for disambiguation_schema in [schema, alt_schema]:
+            if category:
+                break
+            for schema_field in disambiguation_schema.fields.get_all():
                 if schema_field.constraints and schema_field.constraints.category:
-                    category = schema.fields.get_category(name=schema_field.uuid.hex, category=term)
-                    if category:
-                        category = schema.fields.get_category(name=field.uuid.hex, category=category.name)
-                        break
-        if not category:
-            # Any alt schema field
-            for schema_field in alt_schema.fields.get_all():
-                if schema_field.constraints and schema_field.constraints.category:
-                    category = alt_schema.fields.get_category(name=schema_field.uuid.hex, category=term)
+                    category = next(
+                        (c for c in schema_field.constraints.category if c.name == term or c.uuid.hex == term), None
+                    )
                     if category:
                         category = schema.fields.get_category(name=field.uuid.hex, category=category.name)
                         break
@@ -298,7 +301,9 @@ class CategoryParser:
         return f"{root_split[0]} > {hexed[0]}::{hexed[1]} < {hexed[2]}::{hexed[3]}"
 
     def get_assigned_uniques(self, *, text: str) -> list[str]:
-        terms = list(self.parser.generate_contents(text=text))
-        if len(terms) != 1:
+        # Only the first two bracketed terms are needed to tell whether the list is nested
+        terms = self.parser.generate_contents(text=text)
+        first = next(terms, None)
+        if first is None or next(terms, None) is not None:
             raise ValueError(f"Category assignment actions must not be nested. ({text}).")
-        return [self.parser.get_literal(text=t) for t in self.parser.get_split_terms(script=terms[0][1], by=",", maxsplit=-1)]
+        return [self.parser.get_literal(text=t) for t in self.parser.get_split_terms(script=first[1], by=",", maxsplit=-1)]
@@ -2,6 +2,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from pydantic import Json
 import json
+import orjson
 import sys
 import hashlib
 from urllib.parse import urlparse
@@ -12,6 +13,8 @@ from datetime import date, datetime
 from pathlib import Path, PurePath
 import modin.pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 
 # from pandas.util import hash_pandas_object
 import locale
@@ -29,6 +32,9 @@ except locale.Error:
     # Readthedocs has a problem, but difficult to replicate
     locale.setlocale(locale.LC_ALL, "")
 
+# Top-level scalar model metadata which can be updated in place without copying the model's terms
+MODEL_METADATA_FIELDS = frozenset({"name", "title", "description"})
+
 
 class CoreParser:
     """Core functions for file and path management, and general ad-hoc utilities."""
@@ -49,6 +55,37 @@ class CoreParser:
         for i in range(0, len(lst), n):
             yield lst[i : i + n]
 
+    def split_column(self, *, column: pd.Series, by: str) -> np.ndarray:
+        """Split the string values of a column on a separator, returning a two-dimensional object array with a column
+        for each split term, padded with `None`.
+
+        Parameters
+        ----------
+        column: Series
+            Column of string values to split.
+        by: str
+            Separator on which to split.
+
+        Returns
+        -------
+        np.ndarray
+        """
+        try:
+            strings = pa.array(column.to_numpy(), from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            strings = None
+        if strings is None or not pa.types.is_string(strings.type):
+            # Mixed or non-string values are left to pandas, which skips anything that isn't a string
+            return column.str.split(by, expand=True, regex=False).to_numpy()
+        # Split in pyarrow's C kernels, then scatter the flattened terms into rows by their list offsets
+        lists = pc.split_pattern(strings, pattern=by)
+        lengths = pc.list_value_length(lists).fill_null(0).to_numpy()
+        terms = pc.list_flatten(lists).to_numpy(zero_copy_only=False)
+        split = np.full((len(lengths), max(lengths.max(initial=0), 1)), None, dtype=object)
+        starts = np.cumsum(lengths) - lengths
+        split[np.repeat(np.arange(len(lengths)), lengths), np.arange(len(terms)) - np.repeat(starts, lengths)] = terms
+        return split
+
     def show_warning(self, message: str) -> None:
         warnings.warn(message, UserWarning)
 
@@ -65,6 +102,9 @@ class CoreParser:
     ) -> SchemaModel | CrosswalkModel:
         """Update or create a model. Must have a default `name` field as the only dependency.
 
+        Where `source` sets only metadata (such as `name`, `title` or `description`), the existing `model` is patched
+        in place and returned, rather than copied. Otherwise a new, updated copy of `model` is returned.
+
         Parameters
         ----------
         modelType: type of SchemaModel, CrosswalkModel
@@ -72,8 +112,15 @@ class CoreParser:
         source: Path, str or modelType, default None
             Any approach to loading a source.
         model: modelType, default None
-            An existing model to be updated.
+            An existing model to be updated. May be modified in place.
+
+        Returns
+        -------
+        SchemaModel | CrosswalkModel
         """
+        if not source and model:
+            # Nothing to update, so no need to round-trip the existing model through `dict`
+            return model
         # Create a temporary model
         if not source:
             updated_model = modelType(**{"name": randomname.get_name()})
@@ -90,12 +137,16 @@ class CoreParser:
                 )
         # And update the original data
         # https://fastapi.tiangolo.com/tutorial/body-updates/#partial-updates-with-patch
-        # Which doesn't really work properly as it returns dictionaries ... validation / init doesn't happen
-        # This approach may be less efficient, but it does actually parse
+        # Updating from `dict` output would leave unparsed dictionaries in the model, but the updated model's own
+        # attributes are already validated, so only those explicitly set are merged, without a `dict` round-trip
         if model:
-            model = model.dict(by_alias=True, exclude_defaults=True, exclude_none=True)
-            model |= updated_model.dict(exclude_unset=True)
-            return modelType(**model)
+            if updated_model.__fields_set__ <= MODEL_METADATA_FIELDS:
+                # Only scalar metadata changed, so patch the existing model in place rather than copying every term
+                for k in updated_model.__fields_set__:
+                    model.__dict__[k] = getattr(updated_model, k)
+                model.__fields_set__.update(updated_model.__fields_set__)
+                return model
+            return model.copy(update={k: getattr(updated_model, k) for k in updated_model.__fields_set__})
         else:
             return updated_model
 
@@ -184,9 +235,12 @@ class CoreParser:
 
     def get_checksum(self, *, source: str) -> str:
         # https://stackoverflow.com/a/47800021
-        checksum = hashlib.blake2b()
         with open(source, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+ streams the file through the C implementation, releasing the GIL
+                return hashlib.file_digest(f, "blake2b").hexdigest()
+            checksum = hashlib.blake2b()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
                 checksum.update(chunk)
         return checksum.hexdigest()
 
@@ -194,10 +248,12 @@ class CoreParser:
         # The destination data does not have a valid checksum for the file itself, only the data.
         # df_checksum = hash_pandas_object(df.astype("string")._to_pandas(), index=True).values
         # Need to ensure arrays are all of the same type. Easiest is to coerce np arrays to lists
+        # The first row is fetched once, rather than for every column
+        first_row = df.iloc[0] if len(df.columns) else None
         for column in df.columns:
-            if isinstance(df.iloc[0][column], np.ndarray):
+            if isinstance(first_row[column], np.ndarray):
                 df[column] = df[column].apply(lambda x: x.tolist())
-        df_string = df.astype("string").astype("string").to_string(index=False).encode("utf-8")
+        df_string = df.astype("string").to_string(index=False).encode("utf-8")
         checksum = hashlib.blake2b
         return checksum(df_string).hexdigest()
 
@@ -222,12 +278,12 @@ class CoreParser:
         -------
         dict
         """
-        with open(source, "r") as f:
+        with open(source, "rb") as f:
             try:
-                return json.load(f)
-            except json.decoder.JSONDecodeError:
+                return orjson.loads(f.read())
+            except orjson.JSONDecodeError as err:
                 e = "File at `{}` not valid json.".format(source)
-                raise json.decoder.JSONDecodeError(e)
+                raise json.decoder.JSONDecodeError(e, err.doc, err.pos) from err
 
     def save_json(self, *, data: dict, source: str) -> bool:
         """
@@ -242,22 +298,32 @@ class CoreParser:
         -------
         bool, True if saved.
         """
-        with open(source, "w") as f:
-            json.dump(data, f, indent=4, sort_keys=True, default=str)
+        with open(source, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                )
+            )
         return True
 
-    def save_file(self, *, data: json, source: str) -> bool:
+    def save_file(self, *, data: json | bytes | dict | list, source: str) -> bool:
         """Save json to file.
 
         Parameters
         ----------
-        data: dictionary to be saved
+        data: json string, json-encoded bytes, or json-serialisable data to be streamed to file
         source: the filename to save, including path
 
         Returns
         -------
         bool, True if saved.
         """
-        with open(source, "w") as f:
-            f.write(data)
+        with open(source, "wb" if isinstance(data, bytes) else "w") as f:
+            if isinstance(data, (dict, list)):
+                # Encoded in chunks as it is written, so the full json string is never held in memory
+                json.dump(data, f)
+            else:
+                f.write(data)
         return True
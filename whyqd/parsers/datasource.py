@@ -13,7 +13,7 @@ import ast
 
 from whyqd.parsers.core import CoreParser
 from whyqd.models import ColumnModel, DataSourceModel, DataSourceAttributeModel
-from whyqd.dtypes import MimeType, FieldType
+from whyqd.dtypes import MimeType, FieldType, NUMERIC_DTYPES, DATETIME_DTYPES
 from whyqd.config.ray_init import ray_start
 
 try:
@@ -29,16 +29,18 @@ if TYPE_CHECKING:
 class DataSourceParser:
     """Get, review and restructure tabular source data."""
 
+    # Fixed for the process lifetime, so shared by all instances rather than rebuilt with each one
+    DATE_FORMATS = {
+        "date": {"fmt": ["%Y-%m-%d"], "txt": ["YYYY-MM-DD"]},
+        "datetime": {
+            "fmt": ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S %Z%z"],
+            "txt": ["YYYY-MM-DD hh:mm:ss", "YYYY-MM-DD hh:mm:ss UTC+0000"],
+        },
+        "year": {"fmt": ["%Y"], "txt": ["YYYY"]},
+    }
+
     def __init__(self):
         self.core = CoreParser()
-        self.DATE_FORMATS = {
-            "date": {"fmt": ["%Y-%m-%d"], "txt": ["YYYY-MM-DD"]},
-            "datetime": {
-                "fmt": ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M:%S %Z%z"],
-                "txt": ["YYYY-MM-DD hh:mm:ss", "YYYY-MM-DD hh:mm:ss UTC+0000"],
-            },
-            "year": {"fmt": ["%Y"], "txt": ["YYYY"]},
-        }
 
     ###################################################################################################
     ### TABULAR DATA READERS AND WRITERS
@@ -536,9 +538,9 @@ class DataSourceParser:
         try:
             columns = [
                 {"name": k, "type": "number"}
-                if v in ["float64", "int64", "Float64", "Int64"]
+                if v in NUMERIC_DTYPES
                 else {"name": k, "type": "date"}
-                if v in ["datetime64[ns]"]
+                if v in DATETIME_DTYPES
                 else {"name": k, "type": "string"}
                 for k, v in df.dtypes.apply(lambda x: x.name).to_dict().items()
             ]
@@ -546,9 +548,9 @@ class DataSourceParser:
             # No idea ... some seem to give shit
             columns = [
                 {"name": k, "type": "number"}
-                if v in ["float64", "int64", "Float64", "Int64"]
+                if v in NUMERIC_DTYPES
                 else {"name": k, "type": "date"}
-                if v in ["datetime64[ns]"]
+                if v in DATETIME_DTYPES
                 else {"name": k, "type": "string"}
                 for k, v in df.dtypes.apply(lambda x: str(x)).to_dict().items()
             ]
@@ -782,6 +784,18 @@ class DataSourceParser:
                 return np.nan
         return parsed
 
+    def parse_float_column(self, *, column: pd.Series) -> pd.Series:
+        """
+        Column-wise `parse_float`. Values which are already numeric, or convert cleanly, are converted in a single
+        vectorised pass, and only the remaining wrecked floats fall back to the per-value regex parser.
+        """
+        # Nullable string columns convert to nullable integers, which can't take the fallback floats
+        parsed = pd.to_numeric(column, errors="coerce").astype("float64")
+        fallback = parsed.isna() & column.notna()
+        if fallback.any():
+            parsed[fallback] = column[fallback].apply(self.parse_float)
+        return parsed
+
     def parse_int(self, x: str | int | float) -> np.nan | int:
         try:
             return int(str(x).split(".")[0])
@@ -1,7 +1,5 @@
 from __future__ import annotations
 from typing import Type, TYPE_CHECKING
-import modin.pandas as pd
-import numpy as np
 
 from whyqd.parsers import CoreParser, ScriptParser  # , DataSourceParser
 
@@ -9,6 +7,7 @@ if TYPE_CHECKING:
     from whyqd.models import MorphActionModel, FieldModel  # , DataSourceModel
     from whyqd.core import SchemaDefinition
     from whyqd.crosswalk.base import BaseMorphAction
+    import modin.pandas as pd
 
 
 class MorphParser:
@@ -82,9 +81,7 @@ class MorphParser:
             if "fields" in action.structure:
                 # Parsing "< [fields]"
                 # Can be either of `schema_source` or `schema_destination`
-                source = self.get_morph_struts(term=root[1])
-                source = [self.parser.get_literal(text=f) for f in source]
-                source = [self.parser.get_schema_field(term=f, schema=self.schema) for f in source]
+                source = self.get_morph_fields(term=root[1])
         # Parse destination terms
         root = self.parser.get_split_terms(script=root[0], by=">")
         if len(root) == 2:
@@ -95,9 +92,7 @@ class MorphParser:
                 destination_param = self.parser.get_literal(text=optional[0])
                 root[1] = optional[1]
             # Can be either of `schema_source` or `schema_destination`
-            destination = self.get_morph_struts(term=root[1])
-            destination = [self.parser.get_literal(text=f) for f in destination]
-            destination = [self.parser.get_schema_field(term=f, schema=self.schema) for f in destination]
+            destination = self.get_morph_fields(term=root[1])
         # Validate structure
         if (source or destination) and "fields" not in action.structure:
             raise ValueError(f"Script error for {action.name} Morph. Fields are not a valid input.")
@@ -110,7 +105,7 @@ class MorphParser:
                 )
             if "rows" not in action.structure:
                 raise ValueError(f"Script error for {action.name} Morph. Rows are not a valid input.")
-            elif not np.in1d(rows, self.row_indices).all():
+            elif not all(r in self.row_indices for r in rows):
                 raise ValueError("Not all row indices found in source data.")
         else:
             if "rows" in action.structure:
@@ -190,20 +185,31 @@ class MorphParser:
             raise ValueError("Schema for both source and destination has not been provided.")
         self.schema = [schema_source, schema_destination]
         self.row_indices = None
-        if schema_source.get.index:
-            self.row_indices = list(range(schema_source.get.index))
+        index = schema_source.get.index
+        if index:
+            # A range, rather than a list, so membership is a constant-time bounds check without materialising every row
+            self.row_indices = range(index)
 
     def get_hexed_script(self, *, script: str) -> str:
         # Changes fields to uuid hexes
-        all_fields = [field for s in self.schema for field in s.get.fields]
+        all_fields = [field for s in self.schema for field in s.fields.get_all()]
         script = self.parser.get_hexed_script(script=script, fields=all_fields)
         return ",".join([s.strip() for s in script.split(",") if s.strip()])
 
     def get_morph_struts(self, *, term: str) -> list[str]:
-        terms = list(self.parser.generate_contents(text=term))
-        if not terms:
+        # Only the first two bracketed terms are needed to tell whether the list is nested
+        terms = self.parser.generate_contents(text=term)
+        first = next(terms, None)
+        if first is None:
             # It wasn't a list
             return [term]
-        if len(terms) != 1:
+        if next(terms, None) is not None:
             raise ValueError(f"Morph actions must not be nested. ({term}).")
-        return self.parser.get_split_terms(script=terms[0][1], by=",", maxsplit=-1)
+        return self.parser.get_split_terms(script=first[1], by=",", maxsplit=-1)
+
+    def get_morph_fields(self, *, term: str) -> list[FieldModel]:
+        # Resolve each strut to its literal and schema field in a single pass
+        return [
+            self.parser.get_schema_field(term=self.parser.get_literal(text=f), schema=self.schema)
+            for f in self.get_morph_struts(term=term)
+        ]
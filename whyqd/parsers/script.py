@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Type, TYPE_CHECKING
 import ast
+import re
 
 from whyqd.models import SchemaActionModel, MorphActionModel, CategoryActionModel
 
@@ -9,6 +10,9 @@ if TYPE_CHECKING:
     from whyqd.crosswalk.base import BaseSchemaAction, BaseMorphAction, BaseCategoryAction
     from whyqd.core import SchemaDefinition
 
+# The action is everything up to the first `>` or `<` in a script
+ACTION_TERM_SPLIT = re.compile(r"[<>]")
+
 
 class ScriptParser:
     """Parsing utility functions for all types of action scripts.
@@ -20,6 +24,10 @@ class ScriptParser:
     Where term fields are optional. Has no opinion on what the terms are, or whether they are nested.
     """
 
+    # Lazy-loaded lookups of default actions and action classes by name, shared across all parsers
+    _action_models = None
+    _action_classes = None
+
     ###################################################################################################
     ### ACTION UTILITIES
     ###################################################################################################
@@ -37,9 +45,14 @@ class ScriptParser:
         SchemaActionModel, MorphActionModel, CategoryActionModel or None.
             For the requested Action name. Or None, if it doesn't exist.
         """
-        from whyqd.crosswalk.actions import default_actions
+        if ScriptParser._action_models is None:
+            from whyqd.crosswalk.actions import default_actions
 
-        return next((da for da in default_actions if da.name == action.upper()), None)
+            action_models = {}
+            for da in default_actions:
+                action_models.setdefault(da.name, da)
+            ScriptParser._action_models = action_models
+        return ScriptParser._action_models.get(action.upper())
 
     def get_action_from_script(
         self, *, script: str
@@ -60,12 +73,11 @@ class ScriptParser:
         SchemaActionModel, MorphActionModel, or CategoryActionModel.
         """
         # Get the action, where any of the `<` or `>` referenced terms may be absent.
-        root = self.get_split_terms(script=script, by="<")
         # There must always be a first term and it must *always* be an ACTION. Everything else is optional.
-        root = self.get_split_terms(script=root[0], by=">")
-        action = self.get_action_model(action=root[0])
+        root = ACTION_TERM_SPLIT.split(script, maxsplit=1)[0].strip()
+        action = self.get_action_model(action=root)
         if not action:
-            raise ValueError(f"Term '{root[0]} is not a recognised ACTION.")
+            raise ValueError(f"Term '{root} is not a recognised ACTION.")
         return action
 
     def get_action_class(
@@ -81,9 +93,11 @@ class ScriptParser:
         -------
         class of Action
         """
-        from whyqd.crosswalk.actions import actions
+        if ScriptParser._action_classes is None:
+            from whyqd.crosswalk.actions import actions
 
-        return actions[actn.name]
+            ScriptParser._action_classes = actions
+        return ScriptParser._action_classes[actn.name]
 
     ###################################################################################################
     ### FIELD UTILITIES
@@ -189,6 +203,8 @@ class ScriptParser:
         # Going to sort these so the longest is first to avoid replacing partial matches
         # https://docs.python.org/3/howto/sorting.html
         # Bool category names need to be converted to strings
+        # Only the fields quoted in the script need sorting, rather than the whole schema on every call
+        fields = [f for f in fields if f"'{f.name}'" in script]
         for f in sorted(fields, key=lambda f: len(str(f.name)), reverse=True):
             if f"'{f.name}'" in script:
                 script = script.replace(f"'{f.name}'", f"'{f.uuid.hex}'")